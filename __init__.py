@@ -3,9 +3,11 @@ from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN
+from .const import DEVICE_REGISTRY_KEYS, DOMAIN, STATIC_KEYS
 from .srcool_telnet import SRCOOLClient
 
 _LOGGER = logging.getLogger(__name__)
@@ -47,6 +49,62 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await hass.config_entries.async_forward_entry_setups(entry, ["climate", "sensor"])
     return True
 
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate an old config entry's registry entries."""
+    if entry.version > 1:
+        return False
+
+    if entry.minor_version < 2:
+        _migrate_registries(hass, entry)
+        hass.config_entries.async_update_entry(entry, minor_version=2)
+
+    return True
+
+def _sensor_key(unique_id: str) -> str | None:
+    """Return the SRCOOL field a sensor unique ID ("<port>_<key>") refers to."""
+    # longest first so "agent_type" is not mistaken for "type"
+    for key in sorted(STATIC_KEYS, key=len, reverse=True):
+        if unique_id.endswith(f"_{key}"):
+            return key
+    return None
+
+def _migrate_registries(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Merge the climate device into the sensor device and prune static sensors.
+
+    Older versions registered the climate and sensor entities under different
+    device identifiers, and created one enabled sensor per static field.
+    """
+    ent_reg = er.async_get(hass)
+    dev_reg = dr.async_get(hass)
+    entities = er.async_entries_for_config_entry(ent_reg, entry.entry_id)
+
+    sensor_devices = {
+        e.device_id for e in entities if e.domain == "sensor" and e.device_id
+    }
+    if len(sensor_devices) == 1:
+        target = next(iter(sensor_devices))
+        for e in entities:
+            if e.domain != "climate" or e.device_id in (None, target):
+                continue
+            old_device = e.device_id
+            ent_reg.async_update_entity(e.entity_id, device_id=target)
+            if not er.async_entries_for_device(
+                ent_reg, old_device, include_disabled_entities=True
+            ):
+                _LOGGER.info("Merging duplicate SRCOOL device %s into %s", old_device, target)
+                dev_reg.async_remove_device(old_device)
+
+    for e in entities:
+        if e.domain != "sensor":
+            continue
+        key = _sensor_key(e.unique_id)
+        if key in DEVICE_REGISTRY_KEYS:
+            ent_reg.async_remove(e.entity_id)
+        elif key is not None and e.disabled_by is None:
+            ent_reg.async_update_entity(
+                e.entity_id, disabled_by=er.RegistryEntryDisabler.INTEGRATION
+            )
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, ["climate"])
     if unload_ok:
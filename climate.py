@@ -1,11 +1,11 @@
 import logging
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.components.climate import ClimateEntity
 from homeassistant.components.climate.const import ClimateEntityFeature, HVACMode
 from homeassistant.const import UnitOfTemperature
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .entity import device_info
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -18,6 +18,18 @@ async def async_setup_entry(hass, entry, async_add_entities):
     async_add_entities([SRCOOLClimate(hass, client, coordinator)], True)
 
 class SRCOOLClimate(CoordinatorEntity, ClimateEntity):
+    # Static device info is kept out of the recorder's attribute history.
+    _unrecorded_attributes = frozenset({
+        "device_name",
+        "vendor",
+        "product",
+        "protocol",
+        "date_installed",
+        "type",
+        "port_mode",
+        "port_name",
+    })
+
     def __init__(self, hass, client, coordinator):
         super().__init__(coordinator)
         self._attr_unique_id = f"tripp_lite_srcool_{client._host}_{client._port}"
@@ -34,19 +46,6 @@ class SRCOOLClimate(CoordinatorEntity, ClimateEntity):
         # initialize target temperature holder
         self._target_temperature: float | None = None
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device registry information."""
-        data = self.coordinator.data
-        return {
-            # this tuple must be unique per physical device
-            "identifiers": {(DOMAIN, self.unique_id)},
-            "name": data.get("device_name") or self.name,
-            "manufacturer": data.get("vendor"),
-            "model": data.get("product"),
-            "sw_version": data.get("date_installed"),
-        }
-
     @property
     def extra_state_attributes(self):
         return {
@@ -67,14 +66,7 @@ class SRCOOLClimate(CoordinatorEntity, ClimateEntity):
     @property
     def device_info(self):
         """Return device registry information for this device."""
-        data = self.coordinator.data
-        return {
-            "identifiers": {(DOMAIN, data.get("port_name") or self.unique_id)},
-            "manufacturer": data.get("vendor"),
-            "model":        data.get("product"),
-            "name":         self.name,
-            "sw_version":   data.get("date_installed"),
-        }
+        return device_info(self.coordinator.data)
 
     @property
     def hvac_mode(self):
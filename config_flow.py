@@ -24,6 +24,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Tripp Lite SRCOOL."""
 
     VERSION = 1
+    MINOR_VERSION = 2
     reauth_entry = None
 
     async def async_step_user(self, user_input=None) -> FlowResult:
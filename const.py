@@ -1,3 +1,27 @@
 DOMAIN = 'tripp_lite_srcool'
 DEFAULT_PORT = 23
-SCAN_INTERVAL = 60
\ No newline at end of file
+SCAN_INTERVAL = 60
+
+# Fields reported on the device registry entry instead of as sensors.
+DEVICE_REGISTRY_KEYS = {
+    "vendor",
+    "product",
+    "driver_version",
+    "card_serial_number",
+    "mac_address",
+}
+
+# Fields that never change at runtime. Those not in DEVICE_REGISTRY_KEYS are
+# diagnostic sensors, disabled unless the user enables them.
+STATIC_KEYS = DEVICE_REGISTRY_KEYS | {
+    "device_name",
+    "protocol",
+    "date_installed",
+    "type",
+    "port_mode",
+    "port_name",
+    "os",
+    "agent_type",
+    "engine_version",
+    "driver_file_status",
+}
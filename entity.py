@@ -0,0 +1,26 @@
+from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC, format_mac
+from homeassistant.helpers.entity import DeviceInfo
+
+from .const import DOMAIN
+
+
+def device_identifier(data: dict) -> str:
+    """Return the device registry identifier shared by all SRCOOL entities."""
+    return f"tripp_lite_srcool_{data.get('port_name')}"
+
+
+def device_info(data: dict) -> DeviceInfo:
+    """Return device registry information built from a coordinator snapshot."""
+    return {
+        "identifiers": {(DOMAIN, device_identifier(data))},
+        "name": data.get("device_name") or "Tripp Lite SRCOOL",
+        "manufacturer": data.get("vendor"),
+        "model": data.get("product"),
+        "sw_version": data.get("driver_version"),
+        "serial_number": data.get("card_serial_number"),
+        "connections": (
+            {(CONNECTION_NETWORK_MAC, format_mac(data["mac_address"]))}
+            if data.get("mac_address")
+            else set()
+        ),
+    }
@@ -1,10 +1,15 @@
 import logging
 from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.const import UnitOfTemperature
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import EntityCategory
-from .const import DOMAIN
+from .const import DOMAIN, STATIC_KEYS
+from .entity import device_info
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -12,8 +17,6 @@ _LOGGER = logging.getLogger(__name__)
 SENSOR_TYPES: dict[str, tuple[str, str, str | None]] = {
     # Device info
     "device_name":    ("Device Name",          "mdi:information-variant", None),
-    "vendor":         ("Vendor",               "mdi:label", None),
-    "product":        ("Product",              "mdi:label", None),
     "protocol":       ("Protocol",             "mdi:protocol", None),
     "date_installed": ("Date Installed",       "mdi:calendar", None),
     "state":          ("Device State",         "mdi:state-machine", None),
@@ -31,9 +34,6 @@ SENSOR_TYPES: dict[str, tuple[str, str, str | None]] = {
     # Diagnostics keys:
     "os":                 ("OS",                   "mdi:information-variant", None),
     "agent_type":         ("Agent Type",           "mdi:information-variant", None),
-    "mac_address":        ("MAC Address",          "mdi:information-variant", None),
-    "card_serial_number": ("Card Serial Number",   "mdi:numeric", None),
-    "driver_version":     ("Driver Version",       "mdi:numeric", None),
     "engine_version":     ("Engine Version",       "mdi:numeric", None),
     "driver_file_status": ("Driver File Status",   "mdi:information-variant", None),
 }
@@ -41,13 +41,13 @@ SENSOR_TYPES: dict[str, tuple[str, str, str | None]] = {
 DIAGNOSTIC_KEYS = {
     "os",
     "agent_type",
-    "mac_address",
-    "card_serial_number",
-    "driver_version",
     "engine_version",
     "driver_file_status",
 }
 
+# Numeric fields that get long-term statistics instead of raw history.
+TEMPERATURE_KEYS = {"current_temp", "target_temp"}
+
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up SRCOOL status sensors from a config entry."""
     data = hass.data[DOMAIN][entry.entry_id]
@@ -71,22 +71,18 @@ class SRCoolStatusSensor(CoordinatorEntity, SensorEntity):
         self._attr_name = name
         self._attr_native_unit_of_measurement = unit
         self._attr_icon = icon
-        if self._key in DIAGNOSTIC_KEYS:
+        if self._key in STATIC_KEYS:
             self._attr_entity_category = EntityCategory.DIAGNOSTIC
+            self._attr_entity_registry_enabled_default = False
+        if self._key in TEMPERATURE_KEYS:
+            self._attr_device_class = SensorDeviceClass.TEMPERATURE
+            self._attr_state_class = SensorStateClass.MEASUREMENT
         # Will be auto‑linked to the same device as other platform entities
 
     @property
     def device_info(self) -> DeviceInfo:
         """Tie this sensor into the same SRCOOL device as the climate entity."""
-        data = self.coordinator.data
-        # must match the climate entity identifiers exactly
-        return {
-            "identifiers": {(DOMAIN, f"tripp_lite_srcool_{data.get('port_name')}")},
-            "name": data.get("device_name") or "Tripp Lite SRCOOL",
-            "manufacturer": data.get("vendor"),
-            "model": data.get("product"),
-            "sw_version": data.get("date_installed"),
-        }
+        return device_info(self.coordinator.data)
 
     @property
     def unique_id(self) -> str:
@@ -97,4 +93,8 @@ class SRCoolStatusSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self):
         """Return the latest value from the coordinator."""
-        return self.coordinator.data.get(self._key)
+        value = self.coordinator.data.get(self._key)
+        # srcool_telnet reports a return air temperature of 0 when parsing fails
+        if self._key in TEMPERATURE_KEYS and value == 0:
+            return None
+        return value
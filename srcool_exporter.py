@@ -0,0 +1,398 @@
+"""Standalone SRCOOL poller and Prometheus exporter.
+
+Runs without Home Assistant. Each unit listed in the config file is polled
+on its own thread, the last snapshot is cached, and scrapes are served from
+that cache so they never open a telnet session.
+
+Config file (JSON)::
+
+    {
+        "listen": "0.0.0.0:9788",
+        "interval": 30,
+        "units": [
+            {"name": "rack-a", "host": "10.0.0.10", "port": 23,
+             "username": "localadmin", "password": "secret"}
+        ]
+    }
+
+While a unit is down, only srcool_up, srcool_last_success_timestamp_seconds,
+srcool_poll_duration_seconds and srcool_info are exported for it; its
+readings are dropped instead of repeating the last good values. Units that
+have not finished their first poll are not exported at all.
+
+srcool_telnet reports mode and auto_fan as "off" when it cannot parse them,
+so srcool_cooling and srcool_auto_fan cannot tell a parse failure from a
+real "off".
+
+Usage::
+
+    python srcool_exporter.py config.json          # serve /metrics
+    python srcool_exporter.py config.json --once   # poll once, print JSON
+"""
+import argparse
+import json
+import logging
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+try:
+    from .srcool_telnet import SRCOOLClient
+except ImportError:
+    from srcool_telnet import SRCOOLClient
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_LISTEN = "0.0.0.0:9788"
+DEFAULT_INTERVAL = 30
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _choice(mapping: Dict[str, float]):
+    """Return a converter accepting only the strings in `mapping`.
+
+    Matching ignores case and surrounding whitespace; anything else raises
+    KeyError so the sample is skipped.
+    """
+
+    def convert(value: str) -> float:
+        return mapping[value.strip().lower()]
+
+    return convert
+
+
+def _temperature(value: Any) -> float:
+    """Convert a parsed temperature; srcool_telnet reports 0 when parsing fails."""
+    value = float(value)
+    if value == 0:
+        raise ValueError("temperature not parsed")
+    return value
+
+
+# metric name -> (help text, snapshot key, value converter)
+# A converter raising KeyError, TypeError or ValueError skips the sample.
+GAUGES = {
+    "srcool_return_air_temperature_fahrenheit": (
+        "Return air temperature in degrees Fahrenheit.",
+        "current_temp",
+        _temperature,
+    ),
+    "srcool_target_temperature_fahrenheit": (
+        "Target (set-point) temperature in degrees Fahrenheit.",
+        "target_temp",
+        float,
+    ),
+    "srcool_cooling": (
+        "1 if the unit reports it is cooling.",
+        "mode",
+        _choice({"cooling": 1.0, "off": 0.0}),
+    ),
+    "srcool_water_full": (
+        "1 if the water reservoir is reported full.",
+        "water_status",
+        _choice({"full": 1.0, "not full": 0.0}),
+    ),
+    "srcool_quiet_mode": (
+        "1 if quiet mode is enabled.",
+        "quiet_mode",
+        _choice({"enabled": 1.0, "disabled": 0.0}),
+    ),
+    "srcool_auto_fan": (
+        "1 if automatic fan speed is on.",
+        "auto_fan",
+        _choice({"on": 1.0, "off": 0.0}),
+    ),
+}
+
+# Fan speeds exported as one srcool_fan_speed series each.
+FAN_SPEEDS = ["low", "medium", "high", "auto"]
+
+# Static snapshot keys exported as labels on srcool_info.
+INFO_LABELS = [
+    "device_name",
+    "vendor",
+    "product",
+    "mac_address",
+    "card_serial_number",
+    "driver_version",
+    "engine_version",
+    "port_name",
+]
+
+
+def _escape(value: Any) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\n", "\\n")
+        .replace('"', '\\"')
+    )
+
+
+class PollResult(NamedTuple):
+    """Outcome of one poll; replaced as a whole so readers never see a mix."""
+
+    up: bool
+    snapshot: Dict[str, Any]
+    # every device state reported so far, so old states drop to 0
+    states: Tuple[str, ...]
+    last_success: Optional[float]
+    duration: float
+
+
+class UnitPoller:
+    """Poll one SRCOOL unit and keep its last result."""
+
+    def __init__(self, name: str, client: SRCOOLClient):
+        self.name = name
+        self._client = client
+        # None until the first poll has finished
+        self.result: Optional[PollResult] = None
+
+    def poll(self) -> PollResult:
+        """Fetch a fresh snapshot; keep the previous one on failure."""
+        previous = self.result
+        snapshot = previous.snapshot if previous else {}
+        states = previous.states if previous else ()
+        last_success = previous.last_success if previous else None
+        start = time.monotonic()
+        try:
+            snapshot = self._client.get_status()
+            up = True
+            last_success = time.time()
+            state = snapshot.get("state")
+            if state and state not in states:
+                states = states + (state,)
+        except Exception as err:
+            _LOGGER.error("Error polling %s: %s", self.name, err)
+            up = False
+        self.result = PollResult(
+            up, snapshot, states, last_success, time.monotonic() - start
+        )
+        return self.result
+
+
+class Exporter:
+    """Run the pollers and hold the rendered exposition."""
+
+    def __init__(self, pollers: List[UnitPoller], interval: float):
+        self._pollers = pollers
+        self._interval = interval
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._body = self.render().encode()
+
+    def render(self) -> str:
+        """Render every cached result as Prometheus text format.
+
+        Units that have not finished their first poll are left out entirely.
+        """
+        lines = []
+        # read each poller's result once so every family sees the same poll
+        polled = [(p.name, p.result) for p in self._pollers if p.result is not None]
+        up = [(name, r) for name, r in polled if r.up]
+
+        def family(metric: str, help_text: str) -> None:
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} gauge")
+
+        family("srcool_up", "1 if the last poll of the unit succeeded.")
+        for name, r in polled:
+            lines.append(f'srcool_up{{unit="{_escape(name)}"}} {int(r.up)}')
+
+        family(
+            "srcool_last_success_timestamp_seconds",
+            "Unix time of the last successful poll.",
+        )
+        for name, r in polled:
+            if r.last_success is not None:
+                lines.append(
+                    f'srcool_last_success_timestamp_seconds{{unit="{_escape(name)}"}} '
+                    f"{r.last_success:.3f}"
+                )
+
+        family("srcool_poll_duration_seconds", "Duration of the last poll.")
+        for name, r in polled:
+            lines.append(
+                f'srcool_poll_duration_seconds{{unit="{_escape(name)}"}} '
+                f"{r.duration:.3f}"
+            )
+
+        for metric, (help_text, key, convert) in GAUGES.items():
+            family(metric, help_text)
+            for name, r in up:
+                raw = r.snapshot.get(key)
+                if raw is None:
+                    continue
+                try:
+                    value = convert(raw)
+                except (KeyError, TypeError, ValueError):
+                    continue
+                lines.append(f'{metric}{{unit="{_escape(name)}"}} {value}')
+
+        family("srcool_fan_speed", "1 for the fan speed the unit reports.")
+        for name, r in up:
+            fan = r.snapshot.get("fan")
+            if fan not in FAN_SPEEDS:
+                continue
+            for speed in FAN_SPEEDS:
+                lines.append(
+                    f'srcool_fan_speed{{unit="{_escape(name)}",fan="{speed}"}} '
+                    f"{int(speed == fan)}"
+                )
+
+        family("srcool_state", "1 for the device state the unit reports.")
+        for name, r in up:
+            current = r.snapshot.get("state")
+            if not current:
+                continue
+            for state in r.states:
+                lines.append(
+                    f'srcool_state{{unit="{_escape(name)}",state="{_escape(state)}"}} '
+                    f"{int(state == current)}"
+                )
+
+        family("srcool_info", "Static device information as labels.")
+        for name, r in polled:
+            if not r.snapshot:
+                continue
+            labels = [f'unit="{_escape(name)}"'] + [
+                f'{key}="{_escape(r.snapshot.get(key) or "")}"' for key in INFO_LABELS
+            ]
+            lines.append(f"srcool_info{{{','.join(labels)}}} 1")
+
+        return "\n".join(lines) + "\n"
+
+    @property
+    def body(self) -> bytes:
+        with self._lock:
+            return self._body
+
+    def _run(self, poller: UnitPoller) -> None:
+        while not self._stop.is_set():
+            poller.poll()
+            with self._lock:
+                self._body = self.render().encode()
+            self._stop.wait(self._interval)
+
+    def start(self) -> None:
+        for poller in self._pollers:
+            threading.Thread(
+                target=self._run, args=(poller,), name=f"srcool-{poller.name}", daemon=True
+            ).start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+def _make_handler(exporter: Exporter):
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = exporter.body
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            _LOGGER.debug("%s - %s", self.address_string(), format % args)
+
+    return MetricsHandler
+
+
+def load_config(path: str) -> Dict[str, Any]:
+    """Read and validate the JSON config file."""
+    with open(path, encoding="utf-8") as fh:
+        config = json.load(fh)
+    if not config.get("units"):
+        raise ValueError(f"{path}: no units configured")
+    interval = config.get("interval", DEFAULT_INTERVAL)
+    if isinstance(interval, bool) or not isinstance(interval, (int, float)) or interval <= 0:
+        raise ValueError(f"{path}: interval must be a positive number, got {interval!r}")
+    for index, unit in enumerate(config["units"]):
+        label = unit.get("name") or f"#{index}"
+        for field in ("host", "username", "password"):
+            if not unit.get(field):
+                raise ValueError(f"{path}: unit {label} is missing {field!r}")
+    return config
+
+
+def build_pollers(config: Dict[str, Any]) -> List[UnitPoller]:
+    pollers = []
+    for unit in config["units"]:
+        client = SRCOOLClient(
+            unit["host"], unit.get("port", 23), unit["username"], unit["password"]
+        )
+        pollers.append(UnitPoller(unit.get("name") or unit["host"], client))
+    return pollers
+
+
+def parse_listen(address: str) -> Tuple[str, int]:
+    """Split a ``host:port`` listen address; an empty host means all interfaces."""
+    host, sep, port = address.rpartition(":")
+    if not sep or not port.isdigit():
+        raise ValueError(f"invalid listen address: {address!r}")
+    return host.strip("[]") or "0.0.0.0", int(port)
+
+
+def dump_once(pollers: List[UnitPoller]) -> Dict[str, Any]:
+    """Poll every unit concurrently once and return the snapshots."""
+    with ThreadPoolExecutor(max_workers=len(pollers)) as pool:
+        list(pool.map(UnitPoller.poll, pollers))
+    results = {p.name: p.result for p in pollers}
+    return {
+        name: {"up": r.up, "duration": r.duration, "status": r.snapshot}
+        for name, r in results.items()
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("config", help="path to the JSON config file")
+    parser.add_argument(
+        "--once", action="store_true", help="poll every unit once and print JSON"
+    )
+    parser.add_argument("--listen", help="override listen address (host:port)")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    config = load_config(args.config)
+    pollers = build_pollers(config)
+
+    if args.once:
+        result = dump_once(pollers)
+        json.dump(result, sys.stdout, indent=2, default=str)
+        sys.stdout.write("\n")
+        return 0 if all(unit["up"] for unit in result.values()) else 1
+
+    host, port = parse_listen(args.listen or config.get("listen", DEFAULT_LISTEN))
+    exporter = Exporter(pollers, float(config.get("interval", DEFAULT_INTERVAL)))
+    exporter.start()
+
+    server = ThreadingHTTPServer((host, port), _make_handler(exporter))
+    _LOGGER.info("Serving %d unit(s) on %s:%s/metrics", len(pollers), host, port)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        exporter.stop()
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
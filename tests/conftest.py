@@ -0,0 +1,6 @@
+import os
+import sys
+
+# The repository root is a Home Assistant component package; import the
+# standalone modules directly without loading its __init__.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,219 @@
+import json
+
+import pytest
+
+import srcool_exporter
+from srcool_exporter import Exporter, UnitPoller, dump_once, load_config, parse_listen
+
+STATUS = {
+    "device_name": "Rack A",
+    "vendor": 'Tripp "Lite"',
+    "product": "SRCOOL12K",
+    "mac_address": "00:06:67:aa:bb:cc",
+    "port_name": "C:\\port\n1",
+    "state": "Normal",
+    "mode": "cooling",
+    "fan": "medium",
+    "water_status": "Not Full",
+    "quiet_mode": "Disabled",
+    "auto_fan": "off",
+    "current_temp": 72.0,
+    "target_temp": 65.0,
+}
+
+
+class StubClient:
+    def __init__(self, status=None, error=None):
+        self.status = status
+        self.error = error
+
+    def get_status(self):
+        if self.error:
+            raise self.error
+        return dict(self.status)
+
+
+def _poller(name="a", **status):
+    poller = UnitPoller(name, StubClient({**STATUS, **status}))
+    poller.poll()
+    return poller
+
+
+def _samples(text):
+    return [line for line in text.splitlines() if not line.startswith("#")]
+
+
+def test_render_converts_values():
+    text = Exporter([_poller()], 30).render()
+    samples = _samples(text)
+    assert 'srcool_up{unit="a"} 1' in samples
+    assert 'srcool_return_air_temperature_fahrenheit{unit="a"} 72.0' in samples
+    assert 'srcool_target_temperature_fahrenheit{unit="a"} 65.0' in samples
+    assert 'srcool_cooling{unit="a"} 1.0' in samples
+    assert 'srcool_water_full{unit="a"} 0.0' in samples
+    assert 'srcool_quiet_mode{unit="a"} 0.0' in samples
+    assert 'srcool_auto_fan{unit="a"} 0.0' in samples
+    assert 'srcool_fan_speed{unit="a",fan="medium"} 1' in samples
+    assert 'srcool_fan_speed{unit="a",fan="low"} 0' in samples
+    assert 'srcool_state{unit="a",state="Normal"} 1' in samples
+
+
+def test_render_water_full():
+    text = Exporter([_poller(water_status="Full")], 30).render()
+    assert 'srcool_water_full{unit="a"} 1.0' in _samples(text)
+
+
+@pytest.mark.parametrize(
+    "status",
+    [
+        {"water_status": "Normal"},
+        {"mode": "dehumidifying"},
+        {"quiet_mode": "Unknown"},
+        {"auto_fan": "maybe"},
+        {"current_temp": 0},
+        {"target_temp": None},
+        {"fan": "unknown"},
+    ],
+)
+def test_render_skips_unrecognised_values(status):
+    text = Exporter([_poller(**status)], 30).render()
+    key = next(iter(status))
+    metric = {
+        "water_status": "srcool_water_full",
+        "mode": "srcool_cooling",
+        "quiet_mode": "srcool_quiet_mode",
+        "auto_fan": "srcool_auto_fan",
+        "current_temp": "srcool_return_air_temperature_fahrenheit",
+        "target_temp": "srcool_target_temperature_fahrenheit",
+        "fan": "srcool_fan_speed",
+    }[key]
+    assert not any(line.startswith(metric + "{") for line in _samples(text))
+
+
+def test_render_escapes_labels():
+    text = Exporter([_poller(name='rack "a"')], 30).render()
+    info = [line for line in _samples(text) if line.startswith("srcool_info")]
+    assert info == [
+        'srcool_info{unit="rack \\"a\\"",device_name="Rack A",'
+        'vendor="Tripp \\"Lite\\"",product="SRCOOL12K",'
+        'mac_address="00:06:67:aa:bb:cc",card_serial_number="",'
+        'driver_version="",engine_version="",port_name="C:\\\\port\\n1"} 1'
+    ]
+
+
+def test_render_state_history():
+    poller = _poller()
+    poller._client.status = {**STATUS, "state": "Fault"}
+    poller.poll()
+    samples = _samples(Exporter([poller], 30).render())
+    assert 'srcool_state{unit="a",state="Normal"} 0' in samples
+    assert 'srcool_state{unit="a",state="Fault"} 1' in samples
+
+
+def test_render_drops_readings_while_down():
+    poller = _poller()
+    poller._client.error = OSError("timeout")
+    poller.poll()
+    samples = _samples(Exporter([poller], 30).render())
+    assert 'srcool_up{unit="a"} 0' in samples
+    assert any(line.startswith("srcool_info{") for line in samples)
+    assert any(line.startswith("srcool_last_success_timestamp_seconds{") for line in samples)
+    for metric in ("srcool_return_air_temperature_fahrenheit", "srcool_fan_speed", "srcool_state"):
+        assert not any(line.startswith(metric + "{") for line in samples)
+
+
+def test_render_skips_units_not_polled_yet():
+    pending = UnitPoller("pending", StubClient(STATUS))
+    samples = _samples(Exporter([_poller(), pending], 30).render())
+    assert 'srcool_up{unit="a"} 1' in samples
+    assert not any('unit="pending"' in line for line in samples)
+
+
+def test_render_off_mode():
+    text = Exporter([_poller(mode="off")], 30).render()
+    assert 'srcool_cooling{unit="a"} 0.0' in _samples(text)
+
+
+def test_dump_once():
+    pollers = [
+        UnitPoller("a", StubClient(STATUS)),
+        UnitPoller("b", StubClient(error=OSError("refused"))),
+    ]
+    result = dump_once(pollers)
+    assert result["a"]["up"] is True
+    assert result["a"]["status"]["current_temp"] == 72.0
+    assert result["b"] == {"up": False, "duration": result["b"]["duration"], "status": {}}
+
+
+@pytest.mark.parametrize("fail, code", [(False, 0), (True, 1)])
+def test_main_once_exit_status(tmp_path, monkeypatch, capsys, fail, code):
+    config = tmp_path / "srcool.json"
+    config.write_text(
+        json.dumps(
+            {
+                "units": [
+                    {"name": "a", "host": "ok", "username": "u", "password": "p"},
+                    {"name": "b", "host": "bad" if fail else "ok", "username": "u", "password": "p"},
+                ]
+            }
+        )
+    )
+
+    def client(host, port, username, password):
+        if host == "bad":
+            return StubClient(error=OSError("refused"))
+        return StubClient(STATUS)
+
+    monkeypatch.setattr(srcool_exporter, "SRCOOLClient", client)
+    assert srcool_exporter.main([str(config), "--once"]) == code
+    assert set(json.loads(capsys.readouterr().out)) == {"a", "b"}
+
+
+@pytest.mark.parametrize(
+    "address, expected",
+    [
+        ("0.0.0.0:9788", ("0.0.0.0", 9788)),
+        (":9788", ("0.0.0.0", 9788)),
+        ("127.0.0.1:1234", ("127.0.0.1", 1234)),
+        ("[::]:9788", ("::", 9788)),
+    ],
+)
+def test_parse_listen(address, expected):
+    assert parse_listen(address) == expected
+
+
+@pytest.mark.parametrize("address", ["9788", "localhost:", "localhost:http"])
+def test_parse_listen_invalid(address):
+    with pytest.raises(ValueError):
+        parse_listen(address)
+
+
+def _write_config(tmp_path, config):
+    path = tmp_path / "srcool.json"
+    path.write_text(json.dumps(config))
+    return str(path)
+
+
+UNIT = {"name": "a", "host": "h", "username": "u", "password": "p"}
+
+
+def test_load_config(tmp_path):
+    config = load_config(_write_config(tmp_path, {"interval": 15, "units": [UNIT]}))
+    assert config["units"] == [UNIT]
+
+
+@pytest.mark.parametrize(
+    "config, message",
+    [
+        ({"units": []}, "no units"),
+        ({"interval": 0, "units": [UNIT]}, "interval"),
+        ({"interval": -5, "units": [UNIT]}, "interval"),
+        ({"interval": "30", "units": [UNIT]}, "interval"),
+        ({"units": [{**UNIT, "password": None}]}, "unit a is missing 'password'"),
+        ({"units": [UNIT, {"host": "h", "username": "u"}]}, "unit #1 is missing 'password'"),
+        ({"units": [{"username": "u", "password": "p"}]}, "unit #0 is missing 'host'"),
+    ],
+)
+def test_load_config_invalid(tmp_path, config, message):
+    with pytest.raises(ValueError, match=message):
+        load_config(_write_config(tmp_path, config))